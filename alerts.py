@@ -0,0 +1,209 @@
+import operator
+import time
+from collections import deque
+
+METRICS = ("cpu", "ram", "disk", "battery")
+AGGREGATES = ("avg", "min", "max", "last")
+OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+DEFAULT_HYSTERESIS = 5.0
+DEFAULT_COOLDOWN_S = 300.0
+SAMPLE_INTERVAL_MS = 1000
+
+
+class AlertRuleError(Exception):
+    pass
+
+
+class RollingWindow:
+    # Time-based window with a running sum and monotonic min/max queues, so every
+    # push and every aggregate read is amortized O(1) instead of rescanning history.
+    def __init__(self, span_s: float):
+        self.span_s = span_s
+        self._samples: deque[tuple[float, float]] = deque()
+        self._mins: deque[tuple[float, float]] = deque()
+        self._maxs: deque[tuple[float, float]] = deque()
+        self._total = 0.0
+        self._started: float | None = None
+
+    def push(self, now: float, value: float) -> None:
+        if self._started is None:
+            self._started = now
+
+        self._samples.append((now, value))
+        self._total += value
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((now, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((now, value))
+
+        cutoff = now - self.span_s
+        while self._samples[0][0] < cutoff:
+            _t, old = self._samples.popleft()
+            self._total -= old
+        while self._mins[0][0] < cutoff:
+            self._mins.popleft()
+        while self._maxs[0][0] < cutoff:
+            self._maxs.popleft()
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._mins.clear()
+        self._maxs.clear()
+        self._total = 0.0
+        self._started = None
+
+    def is_warm(self, now: float) -> bool:
+        return self._started is not None and now - self._started >= self.span_s
+
+    def value(self, aggregate: str) -> float:
+        if aggregate == "avg":
+            return self._total / len(self._samples)
+        if aggregate == "min":
+            return self._mins[0][1]
+        if aggregate == "max":
+            return self._maxs[0][1]
+        return self._samples[-1][1]
+
+
+class AlertRule:
+    def __init__(
+        self,
+        name: str,
+        metric: str,
+        op: str,
+        threshold: float,
+        window_s: float = 0.0,
+        aggregate: str = "avg",
+        clear_threshold: float | None = None,
+        cooldown_s: float = DEFAULT_COOLDOWN_S,
+        notify: bool = True,
+        command: str = "",
+    ):
+        self.name = name
+        self.metric = metric
+        self.op = op
+        self.threshold = threshold
+        self.window_s = window_s
+        self.aggregate = aggregate
+        if clear_threshold is None:
+            # Hysteresis: a ">" rule only re-arms once the value drops back below
+            # threshold - DEFAULT_HYSTERESIS, and the mirror image for "<".
+            shift = -DEFAULT_HYSTERESIS if op in (">", ">=") else DEFAULT_HYSTERESIS
+            clear_threshold = threshold + shift
+        self.clear_threshold = clear_threshold
+        self.cooldown_s = cooldown_s
+        self.notify = notify
+        self.command = command
+
+        self.window = RollingWindow(window_s)
+        self.active = False
+        self.last_fired: float | None = None
+
+    def describe(self) -> str:
+        window = f" {self.aggregate} over {self.window_s:g} s" if self.window_s else ""
+        return f"{self.metric} {self.op} {self.threshold:g}%{window}"
+
+    def observe(self, now: float, value: float) -> float | None:
+        self.window.push(now, value)
+        if not self.window.is_warm(now):
+            return None
+
+        current = self.window.value(self.aggregate)
+        compare = OPERATORS[self.op]
+        if self.active:
+            if not compare(current, self.clear_threshold):
+                self.active = False
+            return None
+
+        if not compare(current, self.threshold):
+            return None
+        if self.last_fired is not None and now - self.last_fired < self.cooldown_s:
+            return None
+
+        self.active = True
+        self.last_fired = now
+        return current
+
+
+def parse_rule(raw: dict) -> AlertRule:
+    if not isinstance(raw, dict):
+        raise AlertRuleError("Alert rule must be an object")
+
+    metric = raw.get("metric")
+    if metric not in METRICS:
+        raise AlertRuleError(f"Unknown alert metric: {metric}")
+    op = raw.get("op", ">")
+    if op not in OPERATORS:
+        raise AlertRuleError(f"Unknown alert operator: {op}")
+    aggregate = raw.get("aggregate", "avg")
+    if aggregate not in AGGREGATES:
+        raise AlertRuleError(f"Unknown alert aggregate: {aggregate}")
+
+    try:
+        threshold = float(raw["threshold"])
+        window_s = max(0.0, float(raw.get("window_s", 0.0)))
+        cooldown_s = max(0.0, float(raw.get("cooldown_s", DEFAULT_COOLDOWN_S)))
+        clear = raw.get("clear_threshold")
+        clear_threshold = None if clear is None else float(clear)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise AlertRuleError(f"Invalid alert rule: {raw}") from exc
+
+    command = raw.get("command") or ""
+    if not isinstance(command, str):
+        raise AlertRuleError(f"Alert command must be a string: {command}")
+
+    notify = raw.get("notify", True)
+    if not isinstance(notify, bool):
+        raise AlertRuleError(f"Alert notify must be true or false: {notify}")
+
+    return AlertRule(
+        name=str(raw.get("name") or f"{metric} {op} {threshold:g}%"),
+        metric=metric,
+        op=op,
+        threshold=threshold,
+        window_s=window_s,
+        aggregate=aggregate,
+        clear_threshold=clear_threshold,
+        cooldown_s=cooldown_s,
+        notify=notify,
+        command=command.strip(),
+    )
+
+
+def load_rules(raw_rules: list) -> list[AlertRule]:
+    rules = []
+    for raw in raw_rules:
+        try:
+            rules.append(parse_rule(raw))
+        except AlertRuleError:
+            continue
+    return rules
+
+
+class AlertEngine:
+    def __init__(self, rules: list[AlertRule]):
+        self.rules = rules
+
+    def observe(self, metrics: dict, now: float | None = None) -> list[tuple[AlertRule, float]]:
+        if now is None:
+            now = time.monotonic()
+
+        fired = []
+        for rule in self.rules:
+            value = metrics.get(rule.metric)
+            if value is None:
+                # The metric vanished (e.g. battery unplugged); stale samples would
+                # otherwise keep feeding the aggregate once it comes back.
+                rule.window.reset()
+                continue
+            current = rule.observe(now, float(value))
+            if current is not None:
+                fired.append((rule, current))
+        return fired
@@ -0,0 +1,100 @@
+import re
+from collections import deque
+
+MAX_KEPT_LINES = 5000
+MAX_LINE_CHARS = 4000
+
+
+class FilterError(Exception):
+    pass
+
+
+def _compile(pattern: str, what: str) -> re.Pattern | None:
+    if not pattern:
+        return None
+    try:
+        return re.compile(pattern)
+    except re.error as exc:
+        raise FilterError(f"Invalid {what} pattern: {exc}") from exc
+
+
+class HighlightRule:
+    def __init__(self, pattern: str, color: str):
+        self.regex = _compile(pattern, "highlight")
+        self.color = color
+
+
+def load_highlights(raw_rules: list) -> list[HighlightRule]:
+    rules = []
+    for raw in raw_rules:
+        if not isinstance(raw, dict) or not raw.get("pattern") or not raw.get("color"):
+            continue
+        try:
+            rules.append(HighlightRule(str(raw["pattern"]), str(raw["color"])))
+        except FilterError:
+            continue
+    return rules
+
+
+class OutputFilter:
+    # Lines pass include/exclude first; head lines are emitted as they arrive and the
+    # tail is kept in a fixed-size deque until finish(), so memory never depends on
+    # how much the command prints.
+    def __init__(self, include: str = "", exclude: str = "", head: int = 0, tail: int = 0):
+        self.include = _compile(include, "include")
+        self.exclude = _compile(exclude, "exclude")
+        self.head = max(0, min(head, MAX_KEPT_LINES))
+        self.tail = max(0, min(tail, MAX_KEPT_LINES))
+        self._tail_lines: deque[str] = deque(maxlen=self.tail or None)
+        self.total = 0
+        self.matched = 0
+
+    def wants_more(self) -> bool:
+        return not self.head or self.tail > 0 or self.matched < self.head
+
+    def feed(self, line: str) -> str | None:
+        self.total += 1
+        if self.include is not None and self.include.search(line) is None:
+            return None
+        if self.exclude is not None and self.exclude.search(line) is not None:
+            return None
+
+        self.matched += 1
+        if len(line) > MAX_LINE_CHARS:
+            line = line[:MAX_LINE_CHARS] + " …"
+        if self.head and self.matched <= self.head:
+            return line
+        if self.tail:
+            self._tail_lines.append(line)
+            return None
+        return None if self.head else line
+
+    def skip(self, count: int) -> None:
+        self.total += count
+
+    def finish(self) -> list[str]:
+        lines = list(self._tail_lines)
+        self._tail_lines.clear()
+        return lines
+
+    def summary(self) -> str:
+        if not self.wants_more():
+            return f"first {self.head} matching line(s) of {self.total} line(s)"
+
+        kept = ""
+        if self.head and self.tail and self.matched > self.head + self.tail:
+            kept = f"first {self.head} + last {self.tail} of "
+        elif self.tail and not self.head and self.matched > self.tail:
+            kept = f"last {self.tail} of "
+        if self.matched == self.total:
+            return f"{kept}{self.total} line(s)"
+        return f"{kept}{self.matched} of {self.total} line(s) matched"
+
+
+def highlight_spans(line: str, rules: list[HighlightRule]) -> list[tuple[int, int, int]]:
+    spans = []
+    for index, rule in enumerate(rules):
+        for match in rule.regex.finditer(line):
+            if match.end() > match.start():
+                spans.append((match.start(), match.end(), index))
+    return spans
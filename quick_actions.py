@@ -1,44 +1,371 @@
 import os
+import queue
+import shutil
+import signal
 import subprocess
+import threading
+import time
 import webbrowser
+from collections import deque
 from pathlib import Path
 
+DEDUPE_WINDOW_S = 0.5
+REAP_INTERVAL_S = 0.5
+MAX_RESULTS = 100
+READ_CHUNK_BYTES = 64 * 1024
+MAX_LINE_BYTES = 64 * 1024
+MAX_PENDING_LINES = 5000
+
 
 class ActionError(Exception):
     pass
 
 
+class LaunchResult:
+    def __init__(self, kind: str, target: str, latency_ms: float, error: str | None = None):
+        self.kind = kind
+        self.target = target
+        self.latency_ms = latency_ms
+        self.error = error
+
+
+class Launcher:
+    # All spawning happens on one background thread, which also polls its children so
+    # none are left as zombies. The opener and browser are resolved once and reused.
+    def __init__(self, dedupe_window_s: float = DEDUPE_WINDOW_S):
+        self.dedupe_window_s = dedupe_window_s
+        self._requests: queue.Queue = queue.Queue()
+        self._results: deque[LaunchResult] = deque(maxlen=MAX_RESULTS)
+        self._children: list[subprocess.Popen] = []
+        self._recent: dict[tuple, float] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._opener: str | None = None
+        self._opener_resolved = False
+        self._browser = None
+
+    def submit(self, kind: str, target) -> None:
+        with self._lock:
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name="launcher", daemon=True)
+                self._thread.start()
+        self._requests.put((kind, target, time.perf_counter()))
+
+    def pending(self) -> bool:
+        with self._lock:
+            return self._pending > 0
+
+    def results(self) -> list[LaunchResult]:
+        drained = []
+        while self._results:
+            drained.append(self._results.popleft())
+        return drained
+
+    def _worker(self) -> None:
+        while True:
+            timeout = REAP_INTERVAL_S if self._children else None
+            try:
+                batch = [self._requests.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._launch_batch(batch)
+            self._children = [child for child in self._children if child.poll() is None]
+
+    def _launch_batch(self, batch: list) -> None:
+        now = time.perf_counter()
+        self._recent = {key: at for key, at in self._recent.items() if now - at < self.dedupe_window_s}
+        for kind, target, requested in batch:
+            key = (kind, tuple(target) if isinstance(target, list) else target)
+            if key in self._recent:
+                # Double clicks and key repeats collapse into the launch already made.
+                self._finish()
+                continue
+            self._recent[key] = now
+
+            error = None
+            try:
+                self._launch(kind, target)
+            except Exception as exc:  # noqa: BLE001
+                error = str(exc) or exc.__class__.__name__
+            label = " ".join(target) if isinstance(target, list) else target
+            self._results.append(LaunchResult(kind, label, (time.perf_counter() - requested) * 1000.0, error))
+            self._finish()
+
+    def _finish(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _resolve_opener(self) -> str | None:
+        if not self._opener_resolved:
+            self._opener = shutil.which("xdg-open")
+            self._opener_resolved = True
+        return self._opener
+
+    def _launch(self, kind: str, target) -> None:
+        if kind == "argv":
+            self._children.append(subprocess.Popen(target))
+            return
+
+        if os.name == "nt":
+            os.startfile(target)  # type: ignore[attr-defined]
+            return
+
+        opener = self._resolve_opener()
+        if opener is not None:
+            self._children.append(subprocess.Popen([opener, target]))
+            return
+        if kind == "path":
+            raise ActionError("xdg-open is not available")
+
+        if self._browser is None:
+            self._browser = webbrowser.get()
+        if not self._browser.open(target):
+            raise ActionError(f"Failed to open URL: {target}")
+
+
+_launcher = Launcher()
+
+
 def open_path(path: str) -> None:
     target = Path(path).expanduser()
     if not target.exists():
         raise ActionError(f"Path does not exist: {target}")
-
-    try:
-        if os.name == "nt":
-            os.startfile(target)  # type: ignore[attr-defined]
-        else:
-            subprocess.Popen(["xdg-open", str(target)])
-    except Exception as exc:  # noqa: BLE001
-        raise ActionError(str(exc)) from exc
+    _launcher.submit("path", str(target))
 
 
 def open_web(url: str) -> None:
-    ok = webbrowser.open(url)
-    if not ok:
-        raise ActionError(f"Failed to open URL: {url}")
+    _launcher.submit("url", url)
+
+
+def send_notification(title: str, body: str) -> None:
+    if shutil.which("notify-send") is None:
+        raise ActionError("notify-send is not available")
+    _launcher.submit("argv", ["notify-send", "--app-name=Mini OS Helper", title, body])
+
+
+def launches_pending() -> bool:
+    return _launcher.pending()
+
+
+def launch_results() -> list[LaunchResult]:
+    return _launcher.results()
 
 
-def run_command(command: str) -> tuple[int, str]:
+def run_command(command: str, timeout: float = 20) -> tuple[int, str]:
     try:
         completed = subprocess.run(
             command,
             shell=True,
             text=True,
             capture_output=True,
-            timeout=20,
+            timeout=timeout,
         )
     except Exception as exc:  # noqa: BLE001
         raise ActionError(str(exc)) from exc
 
     output = (completed.stdout or "") + (completed.stderr or "")
     return completed.returncode, output.strip()
+
+
+def spawn_command(command: str) -> subprocess.Popen:
+    # Each command gets its own session so kill_process_group() also reaches
+    # anything the shell started.
+    try:
+        return subprocess.Popen(
+            command,
+            shell=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=os.name != "nt",
+        )
+    except Exception as exc:  # noqa: BLE001
+        raise ActionError(str(exc)) from exc
+
+
+def kill_process_group(process: subprocess.Popen) -> None:
+    if process.poll() is not None:
+        return
+    try:
+        if os.name == "nt":
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, ProcessLookupError):
+        pass
+
+
+def run_command_tail(command: str, timeout: float, max_chars: int, on_start=None) -> tuple[int | None, str]:
+    # Like run_command, but output is read incrementally and only the last max_chars
+    # are kept, so a chatty command can't grow memory without bound.
+    process = spawn_command(command)
+    if on_start is not None:
+        on_start(process)
+
+    timed_out = threading.Event()
+
+    def expire() -> None:
+        timed_out.set()
+        kill_process_group(process)
+
+    timer = threading.Timer(timeout, expire)
+    timer.daemon = True
+    timer.start()
+
+    max_bytes = max_chars * 4
+    chunks: deque[bytes] = deque()
+    size = 0
+    try:
+        while True:
+            chunk = process.stdout.read1(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            while size - len(chunks[0]) >= max_bytes:
+                size -= len(chunks.popleft())
+        code = process.wait()
+    finally:
+        timer.cancel()
+        process.stdout.close()
+
+    if timed_out.is_set():
+        return None, f"Command timed out after {timeout:g} seconds"
+    output = b"".join(chunks)[-max_bytes:].decode("utf-8", errors="replace")
+    return code, output.strip()[-max_chars:]
+
+
+class StreamedCommand:
+    # Output is read in fixed-size chunks on a background thread: raw bytes go straight
+    # to the optional tee file, and only lines the filter keeps are queued for the UI,
+    # in a bounded deque whose overflow is counted rather than stored.
+    def __init__(self, command: str, output_filter, tee_path: str = "", overwrite: bool = False):
+        self.command = command
+        self.output_filter = output_filter
+        self.tee_path = None
+        if tee_path:
+            path = Path(tee_path).expanduser()
+            self.tee_path = path if path.is_absolute() else Path.home() / path
+        self.overwrite = overwrite
+        self.returncode: int | None = None
+        self.error: str | None = None
+        self.stopped = False
+        self.tee_bytes = 0
+        self._dropped = 0
+        self._pending: deque[str] = deque(maxlen=MAX_PENDING_LINES)
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._process: subprocess.Popen | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def start(self) -> None:
+        tee = None
+        if self.tee_path is not None:
+            try:
+                tee = self.tee_path.open("wb" if self.overwrite else "xb")
+            except FileExistsError as exc:
+                raise ActionError(f"Tee file already exists: {self.tee_path}") from exc
+            except OSError as exc:
+                raise ActionError(f"Cannot open tee file: {exc}") from exc
+
+        try:
+            self._process = spawn_command(self.command)
+        except ActionError:
+            if tee is not None:
+                tee.close()
+            raise
+
+        threading.Thread(target=self._pump, args=(tee,), name="command-stream", daemon=True).start()
+
+    def stop(self) -> None:
+        self.stopped = True
+        if self._process is not None:
+            kill_process_group(self._process)
+
+    def drain(self) -> tuple[list[str], int]:
+        with self._lock:
+            lines = list(self._pending)
+            self._pending.clear()
+            dropped, self._dropped = self._dropped, 0
+        return lines, dropped
+
+    def _queue(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        with self._lock:
+            overflow = len(self._pending) + len(lines) - MAX_PENDING_LINES
+            if overflow > 0:
+                self._dropped += overflow
+            self._pending.extend(lines)
+
+    def _feed(self, raw_lines: list[bytes]) -> None:
+        shown = []
+        for raw in raw_lines:
+            line = self.output_filter.feed(raw.rstrip(b"\r").decode("utf-8", errors="replace"))
+            if line is not None:
+                shown.append(line)
+        self._queue(shown)
+
+    def _pump(self, tee) -> None:
+        stream = self._process.stdout
+        partial = b""
+        discarding = False
+        try:
+            while True:
+                chunk = stream.read1(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                if tee is not None:
+                    tee.write(chunk)
+                    self.tee_bytes += len(chunk)
+                if discarding:
+                    # The rest of an over-long line that was already fed truncated.
+                    end = chunk.find(b"\n")
+                    if end < 0:
+                        continue
+                    chunk = chunk[end + 1 :]
+                    discarding = False
+                if not self.output_filter.wants_more():
+                    # Head limit reached: just count lines while the tee keeps writing.
+                    # Only the last byte of an unfinished line is kept, to count it at EOF.
+                    data = partial + chunk
+                    self.output_filter.skip(data.count(b"\n"))
+                    partial = b"" if data.endswith(b"\n") else data[-1:]
+                    continue
+
+                lines = (partial + chunk).split(b"\n")
+                partial = lines.pop()
+                if len(partial) > MAX_LINE_BYTES:
+                    lines.append(partial[:MAX_LINE_BYTES])
+                    partial = b""
+                    discarding = True
+                self._feed(lines)
+
+            if partial:
+                if self.output_filter.wants_more():
+                    self._feed([partial])
+                else:
+                    self.output_filter.skip(1)
+            self.returncode = self._process.wait()
+        except Exception as exc:  # noqa: BLE001
+            self.error = str(exc)
+            self.stop()
+            self.returncode = self._process.wait()
+        finally:
+            stream.close()
+            if tee is not None:
+                tee.close()
+            self._queue(self.output_filter.finish())
+            self._done.set()
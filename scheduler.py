@@ -0,0 +1,283 @@
+import heapq
+import itertools
+import queue
+import subprocess
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from quick_actions import kill_process_group, run_command_tail
+
+DEFAULT_HISTORY = 10
+DEFAULT_TIMEOUT_S = 20
+MAX_OUTPUT_CHARS = 4000
+MAX_WORKERS = 4
+
+CRON_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+
+
+class ScheduleError(Exception):
+    pass
+
+
+def _parse_cron_field(text: str, low: int, high: int) -> set[int]:
+    values = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(step_text)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(part)
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSpec:
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != len(CRON_FIELDS):
+            raise ScheduleError(f"Cron spec needs 5 fields: {expression}")
+
+        parsed = []
+        for text, (name, low, high) in zip(fields, CRON_FIELDS):
+            try:
+                parsed.append(_parse_cron_field(text, low, high))
+            except ValueError as exc:
+                raise ScheduleError(f"Invalid cron {name} field: {text}") from exc
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        if 7 in weekdays:
+            weekdays = (weekdays - {7}) | {0}
+        self.weekdays = weekdays
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.isoweekday() % 7) in self.weekdays
+        # Classic cron: when both day fields are restricted, either one may match.
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        moment = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        # Skip whole months/days/hours at a time, so even sparse specs resolve in a
+        # few thousand steps rather than walking every minute.
+        while moment < limit:
+            if moment.month not in self.months:
+                year, month = divmod(moment.month, 12)
+                moment = moment.replace(year=moment.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(moment):
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+            elif moment.hour not in self.hours:
+                moment = (moment + timedelta(hours=1)).replace(minute=0)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ScheduleError(f"Cron spec never fires: {self.expression}")
+
+
+class JobRun:
+    def __init__(self, started: float, finished: float, code: int | None, output: str):
+        self.started = started
+        self.finished = finished
+        self.code = code
+        self.output = output
+
+
+class ScheduledJob:
+    def __init__(
+        self,
+        name: str,
+        command: str,
+        every_s: float | None = None,
+        cron: CronSpec | None = None,
+        max_overlap: int = 1,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        history: int = DEFAULT_HISTORY,
+    ):
+        self.name = name
+        self.command = command
+        self.every_s = every_s
+        self.cron = cron
+        self.max_overlap = max_overlap
+        self.timeout_s = timeout_s
+        self.history: deque[JobRun] = deque(maxlen=history)
+        self.running = 0
+        self.skipped = 0
+
+    def describe(self) -> str:
+        if self.cron is not None:
+            return f"cron '{self.cron.expression}'"
+        return f"every {self.every_s:g} s"
+
+    def next_run(self, now: float) -> float:
+        if self.cron is not None:
+            return self.cron.next_after(datetime.fromtimestamp(now)).timestamp()
+        return now + self.every_s
+
+
+def parse_job(raw: dict) -> ScheduledJob:
+    if not isinstance(raw, dict):
+        raise ScheduleError("Scheduled job must be an object")
+
+    command = raw.get("command")
+    if not isinstance(command, str) or not command.strip():
+        raise ScheduleError(f"Scheduled job needs a command: {raw}")
+
+    every_s = None
+    cron = None
+    try:
+        if raw.get("cron"):
+            cron = CronSpec(str(raw["cron"]))
+            cron.next_after(datetime.now())
+        else:
+            every_s = float(raw["every_s"])
+            if every_s < 1:
+                raise ScheduleError(f"Scheduled job interval must be at least 1 s: {raw}")
+        max_overlap = max(1, int(raw.get("max_overlap", 1)))
+        timeout_s = max(1.0, float(raw.get("timeout_s", DEFAULT_TIMEOUT_S)))
+        history = max(1, int(raw.get("history", DEFAULT_HISTORY)))
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ScheduleError(f"Invalid scheduled job: {raw}") from exc
+
+    return ScheduledJob(
+        name=str(raw.get("name") or command.strip()),
+        command=command.strip(),
+        every_s=every_s,
+        cron=cron,
+        max_overlap=max_overlap,
+        timeout_s=timeout_s,
+        history=history,
+    )
+
+
+def load_jobs(raw_jobs: list) -> list[ScheduledJob]:
+    jobs = []
+    for raw in raw_jobs:
+        if isinstance(raw, dict) and not raw.get("enabled", True):
+            continue
+        try:
+            jobs.append(parse_job(raw))
+        except ScheduleError:
+            continue
+    return jobs
+
+
+class Scheduler:
+    # One min-heap of (due_time, seq, job) drives every job; the caller only needs a
+    # single timer armed for next_delay(), so idle cost doesn't grow with job count.
+    # Workers are daemon threads and their children are tracked, so shutdown() never
+    # waits on a job that is still running.
+    def __init__(self, jobs: list[ScheduledJob], max_workers: int = MAX_WORKERS):
+        self.jobs = []
+        self._seq = itertools.count()
+        self._heap: list[tuple[float, int, ScheduledJob]] = []
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._max_workers = max_workers
+        self._processes: set[subprocess.Popen] = set()
+        self._closed = False
+
+        now = time.time()
+        for job in jobs:
+            if self._push(job, now):
+                self.jobs.append(job)
+
+    def _push(self, job: ScheduledJob, now: float) -> bool:
+        try:
+            due = job.next_run(now)
+        except ScheduleError:
+            return False
+        heapq.heappush(self._heap, (due, next(self._seq), job))
+        return True
+
+    def next_delay(self, now: float | None = None) -> float | None:
+        if not self._heap:
+            return None
+        if now is None:
+            now = time.time()
+        return max(0.0, self._heap[0][0] - now)
+
+    def run_due(self, now: float | None = None) -> int:
+        if now is None:
+            now = time.time()
+
+        started = 0
+        while self._heap and self._heap[0][0] <= now and not self._closed:
+            _due, _seq, job = heapq.heappop(self._heap)
+            self._push(job, now)
+            with self._lock:
+                if job.running >= job.max_overlap:
+                    job.skipped += 1
+                    continue
+                job.running += 1
+            if not self._workers:
+                for index in range(self._max_workers):
+                    worker = threading.Thread(target=self._worker, name=f"scheduled-job-{index}", daemon=True)
+                    worker.start()
+                    self._workers.append(worker)
+            self._queue.put(job)
+            started += 1
+        return started
+
+    def history(self, job: ScheduledJob) -> list[JobRun]:
+        with self._lock:
+            return list(job.history)
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            if self._closed:
+                return
+            self._run_job(job)
+
+    def _run_job(self, job: ScheduledJob) -> None:
+        started = time.time()
+        spawned: list[subprocess.Popen] = []
+
+        def track(process: subprocess.Popen) -> None:
+            with self._lock:
+                self._processes.add(process)
+            spawned.append(process)
+
+        code, output = None, ""
+        try:
+            code, output = run_command_tail(job.command, job.timeout_s, MAX_OUTPUT_CHARS, on_start=track)
+        except Exception as exc:  # noqa: BLE001
+            output = str(exc) or exc.__class__.__name__
+        finally:
+            with self._lock:
+                self._processes.difference_update(spawned)
+                job.running -= 1
+                job.history.append(JobRun(started, time.time(), code, output))
+
+    def shutdown(self) -> None:
+        self._closed = True
+        with self._lock:
+            processes = list(self._processes)
+        for process in processes:
+            kill_process_group(process)
@@ -18,6 +18,12 @@ DEFAULT_SETTINGS = {
         "YouTube": "https://www.youtube.com",
         "GitHub": "https://github.com",
     },
+    "alerts": [],
+    "scheduled_jobs": [],
+    "output_highlights": [
+        {"pattern": r"(?i)\b(error|failed|fatal)\b", "color": "#f87171"},
+        {"pattern": r"(?i)\bwarn(ing)?\b", "color": "#fbbf24"},
+    ],
 }
 
 
@@ -46,6 +52,12 @@ def load_settings() -> dict:
         merged["favorites"] = DEFAULT_SETTINGS["favorites"]
     if not isinstance(merged.get("web_shortcuts"), dict):
         merged["web_shortcuts"] = DEFAULT_SETTINGS["web_shortcuts"]
+    if not isinstance(merged.get("alerts"), list):
+        merged["alerts"] = []
+    if not isinstance(merged.get("scheduled_jobs"), list):
+        merged["scheduled_jobs"] = []
+    if not isinstance(merged.get("output_highlights"), list):
+        merged["output_highlights"] = DEFAULT_SETTINGS["output_highlights"]
 
     return merged
 
@@ -27,7 +27,9 @@ def get_system_snapshot(cpu_interval: float = 0.0) -> dict:
         "disk": "N/A",
         "battery": "N/A",
         "processes": "N/A",
+        "metrics": {},
     }
+    metrics = info["metrics"]
 
     if psutil is not None:
         try:
@@ -40,18 +42,21 @@ def get_system_snapshot(cpu_interval: float = 0.0) -> dict:
             pass
 
         try:
-            info["cpu"] = f"{psutil.cpu_percent(interval=cpu_interval):.1f}%"
+            metrics["cpu"] = psutil.cpu_percent(interval=cpu_interval)
+            info["cpu"] = f"{metrics['cpu']:.1f}%"
         except Exception:  # noqa: BLE001
             pass
 
         try:
             mem = psutil.virtual_memory()
+            metrics["ram"] = mem.percent
             info["ram"] = f"{mem.percent:.1f}% ({_human_bytes(mem.used)} / {_human_bytes(mem.total)})"
         except Exception:  # noqa: BLE001
             pass
 
         try:
             disk = psutil.disk_usage(str(Path.home()))
+            metrics["disk"] = disk.percent
             info["disk"] = f"{disk.percent:.1f}% ({_human_bytes(disk.used)} / {_human_bytes(disk.total)})"
         except Exception:  # noqa: BLE001
             pass
@@ -59,6 +64,7 @@ def get_system_snapshot(cpu_interval: float = 0.0) -> dict:
         try:
             bat = psutil.sensors_battery()
             if bat is not None:
+                metrics["battery"] = bat.percent
                 charging = " (charging)" if bat.power_plugged else ""
                 info["battery"] = f"{bat.percent:.1f}%{charging}"
         except Exception:  # noqa: BLE001
@@ -70,6 +76,8 @@ def get_system_snapshot(cpu_interval: float = 0.0) -> dict:
             pass
     else:
         total, used, _free = shutil.disk_usage(Path.home())
+        if total:
+            metrics["disk"] = used / total * 100.0
         info["disk"] = f"{_human_bytes(used)} / {_human_bytes(total)}"
 
     return info
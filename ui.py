@@ -1,10 +1,26 @@
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from quick_actions import ActionError, open_path, open_web, run_command
+from alerts import SAMPLE_INTERVAL_MS, AlertEngine, load_rules
+from output_filter import FilterError, OutputFilter, highlight_spans, load_highlights
+from quick_actions import (
+    ActionError,
+    StreamedCommand,
+    launch_results,
+    launches_pending,
+    open_path,
+    open_web,
+    run_command,
+    send_notification,
+)
+from scheduler import Scheduler, load_jobs
 from settings import load_notes, load_settings, save_notes, save_settings
 from system_info import get_system_snapshot
 
+MAX_OUTPUT_LINES = 5000
+
 THEMES = {
     "dark": {
         "root": "#0f172a",
@@ -141,12 +157,22 @@ class MiniOSHelperApp:
 
         self._auto_refresh_id = None
         self._interval_debounce_id = None
+        self.alert_engine = AlertEngine(load_rules(self.settings.get("alerts", [])))
+        self._alert_sample_id = None
+        self.scheduler = Scheduler(load_jobs(self.settings.get("scheduled_jobs", [])))
+        self._scheduler_id = None
+        self._launch_poll_id = None
+        self._command_run = None
+        self.highlights = load_highlights(self.settings.get("output_highlights", []))
 
         self._build_ui()
         self.apply_theme(self.theme_var.get())
         self._refresh_system_once(set_status=False)
         if self.auto_refresh_var.get():
             self._schedule_auto_refresh()
+        self._schedule_alert_sample()
+        self._arm_scheduler()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_ui(self):
         self.style = ttk.Style()
@@ -265,9 +291,40 @@ class MiniOSHelperApp:
         self.run_btn = RoundedButton(run_frame, "Run", self._run_command, width=78)
         self.run_btn.grid(row=0, column=1, padx=(6, 0))
 
+        self.stop_btn = RoundedButton(run_frame, "Stop", self._stop_command, width=78)
+        self.stop_btn.grid(row=0, column=2, padx=(6, 0))
+        self.stop_btn.set_enabled(False)
+
+        self.jobs_btn = RoundedButton(run_frame, "Jobs", self._show_job_history, width=78)
+        self.jobs_btn.grid(row=0, column=3, padx=(6, 0))
+
+        filter_row = tk.Frame(run_frame)
+        filter_row.grid(row=1, column=0, columnspan=4, sticky="ew", pady=(8, 0))
+        filter_row.columnconfigure(1, weight=1)
+        filter_row.columnconfigure(3, weight=1)
+        filter_row.columnconfigure(9, weight=1)
+
+        self.include_var = tk.StringVar()
+        self.exclude_var = tk.StringVar()
+        self.head_var = tk.IntVar(value=0)
+        self.tail_var = tk.IntVar(value=0)
+        self.tee_var = tk.StringVar()
+        fields = (
+            ("Include:", ttk.Entry(filter_row, textvariable=self.include_var, width=14, style="App.TEntry")),
+            ("Exclude:", ttk.Entry(filter_row, textvariable=self.exclude_var, width=14, style="App.TEntry")),
+            ("Head:", ttk.Spinbox(filter_row, from_=0, to=MAX_OUTPUT_LINES, increment=10, textvariable=self.head_var, width=6, style="App.TSpinbox")),
+            ("Tail:", ttk.Spinbox(filter_row, from_=0, to=MAX_OUTPUT_LINES, increment=10, textvariable=self.tail_var, width=6, style="App.TSpinbox")),
+            ("Tee to file:", ttk.Entry(filter_row, textvariable=self.tee_var, width=18, style="App.TEntry")),
+        )
+        for index, (label, widget) in enumerate(fields):
+            tk.Label(filter_row, text=label, font=("Adwaita Sans", 10)).grid(row=0, column=2 * index, padx=(0 if index == 0 else 8, 4))
+            widget.grid(row=0, column=2 * index + 1, sticky="ew")
+
         self.cmd_output = tk.Text(tab, wrap="word", font=("Adwaita Mono", 10), state="disabled")
         self.cmd_output.grid(row=3, column=0, sticky="nsew", padx=12, pady=(6, 12))
         self.cmd_output.bind("<Button-3>", self._show_output_context)
+        for index, rule in enumerate(self.highlights):
+            self.cmd_output.tag_configure(f"highlight{index}", foreground=rule.color)
 
         self._populate_action_buttons()
 
@@ -371,6 +428,35 @@ class MiniOSHelperApp:
         if set_status:
             self.status_var.set(f"System info refreshed ({self.refresh_interval_var.get()} ms)")
 
+    def _schedule_alert_sample(self):
+        # Alerts sample on their own timer so they keep working with auto refresh off.
+        if self.alert_engine.rules:
+            self._alert_sample_id = self.root.after(SAMPLE_INTERVAL_MS, self._tick_alert_sample)
+
+    def _tick_alert_sample(self):
+        self._alert_sample_id = None
+        data = get_system_snapshot(cpu_interval=0.0)
+        for rule, value in self.alert_engine.observe(data["metrics"]):
+            self._fire_alert(rule, value)
+        self._schedule_alert_sample()
+
+    def _fire_alert(self, rule, value: float):
+        message = f"Alert: {rule.name} ({rule.describe()}, now {value:.1f}%)"
+        self.status_var.set(message)
+        if rule.notify:
+            try:
+                send_notification("Mini OS Helper", message)
+            except ActionError:
+                pass
+        if rule.command:
+            threading.Thread(target=self._run_alert_command, args=(rule.command,), daemon=True).start()
+
+    def _run_alert_command(self, command: str):
+        try:
+            run_command(command)
+        except ActionError:
+            pass
+
     def refresh_system(self):
         self._refresh_system_once(set_status=True)
 
@@ -420,32 +506,167 @@ class MiniOSHelperApp:
     def _open_path(self, path: str):
         try:
             open_path(path)
-            self.status_var.set(f"Opened {path}")
         except ActionError as exc:
             messagebox.showerror("Open Path Failed", str(exc))
+            return
+        self.status_var.set(f"Opening {path}...")
+        self._watch_launches()
 
     def _open_web(self, url: str):
         try:
             open_web(url)
-            self.status_var.set(f"Opened {url}")
         except ActionError as exc:
             messagebox.showerror("Open Web Failed", str(exc))
+            return
+        self.status_var.set(f"Opening {url}...")
+        self._watch_launches()
+
+    def _watch_launches(self):
+        if self._launch_poll_id is None:
+            self._launch_poll_id = self.root.after(30, self._poll_launches)
+
+    def _poll_launches(self):
+        self._launch_poll_id = None
+        for result in launch_results():
+            if result.kind == "argv":
+                continue
+            if result.error:
+                title = "Open Path Failed" if result.kind == "path" else "Open Web Failed"
+                messagebox.showerror(title, f"{result.target}: {result.error}")
+            else:
+                self.status_var.set(f"Opened {result.target} ({result.latency_ms:.0f} ms)")
+        if launches_pending():
+            self._watch_launches()
 
     def _run_command(self):
         cmd = self.cmd_var.get().strip()
-        if not cmd:
+        if not cmd or self._command_run is not None:
             return
         try:
-            code, output = run_command(cmd)
+            output_filter = OutputFilter(
+                include=self.include_var.get().strip(),
+                exclude=self.exclude_var.get().strip(),
+                head=int(self.head_var.get() or 0),
+                tail=int(self.tail_var.get() or 0),
+            )
+        except (FilterError, tk.TclError, ValueError) as exc:
+            messagebox.showerror("Invalid Filter", str(exc))
+            return
+
+        command_run = StreamedCommand(cmd, output_filter, tee_path=self.tee_var.get().strip())
+        if command_run.tee_path is not None and command_run.tee_path.exists():
+            if not messagebox.askyesno("Overwrite Tee File", f"{command_run.tee_path} already exists. Overwrite it?"):
+                return
+            command_run.overwrite = True
+        try:
+            command_run.start()
         except ActionError as exc:
             messagebox.showerror("Command Failed", str(exc))
             return
 
+        self._clear_output()
+        self._set_command_running(command_run)
+        self._append_output([f"$ {cmd}", ""])
+        self.status_var.set(f"Running {cmd}...")
+        self.root.after(50, self._poll_command)
+
+    def _set_command_running(self, command_run):
+        # Jobs and Clear both rewrite the output pane, so they wait until the run ends.
+        self._command_run = command_run
+        idle = command_run is None
+        self.run_btn.set_enabled(idle)
+        self.stop_btn.set_enabled(not idle)
+        self.jobs_btn.set_enabled(idle)
+        self.output_menu.entryconfigure("Clear", state="normal" if idle else "disabled")
+
+    def _stop_command(self):
+        if self._command_run is not None:
+            self._command_run.stop()
+
+    def _poll_command(self):
+        command_run = self._command_run
+        done = command_run.done
+        lines, dropped = command_run.drain()
+        if dropped:
+            self._append_output([f"... {dropped} line(s) skipped ..."])
+        self._append_output(lines)
+        if not done:
+            self.root.after(50, self._poll_command)
+            return
+
+        self._set_command_running(None)
+
+        if command_run.error:
+            result = f"Failed: {command_run.error}"
+        elif command_run.stopped:
+            result = "Stopped"
+        else:
+            result = f"Exit code: {command_run.returncode}"
+        details = command_run.output_filter.summary()
+        if command_run.tee_path is not None:
+            details += f", {command_run.tee_bytes} bytes written to {command_run.tee_path}"
+        self._append_output(["", f"{result} ({details})"])
+        self.status_var.set(f"Command finished: {result.lower()}")
+
+    def _append_output(self, lines: list[str]):
+        if not lines:
+            return
+        self.cmd_output.configure(state="normal")
+        for line in lines:
+            start = self.cmd_output.index("end-1c")
+            self.cmd_output.insert(tk.END, line + "\n")
+            for begin, end, index in highlight_spans(line, self.highlights):
+                self.cmd_output.tag_add(f"highlight{index}", f"{start}+{begin}c", f"{start}+{end}c")
+
+        excess = int(self.cmd_output.index("end-1c").split(".")[0]) - MAX_OUTPUT_LINES
+        if excess > 0:
+            self.cmd_output.delete("1.0", f"{excess + 1}.0")
+        self.cmd_output.configure(state="disabled")
+        self.cmd_output.see(tk.END)
+
+    def _arm_scheduler(self):
+        if self._scheduler_id is not None:
+            self.root.after_cancel(self._scheduler_id)
+            self._scheduler_id = None
+        delay = self.scheduler.next_delay()
+        if delay is None:
+            return
+        # Re-check at least once a minute so wall-clock jumps (suspend, NTP) can't
+        # leave a job waiting on a stale deadline.
+        self._scheduler_id = self.root.after(int(min(delay, 60.0) * 1000) + 1, self._tick_scheduler)
+
+    def _tick_scheduler(self):
+        self._scheduler_id = None
+        self.scheduler.run_due()
+        self._arm_scheduler()
+
+    def _show_job_history(self):
+        lines = []
+        for job in self.scheduler.jobs:
+            lines.append(f"{job.name} ({job.describe()}): {job.command}")
+            if job.skipped:
+                lines.append(f"  skipped {job.skipped} overlapping run(s)")
+            history = self.scheduler.history(job)
+            if not history:
+                lines.append("  (no runs yet)")
+            for run in reversed(history):
+                started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run.started))
+                code = "error" if run.code is None else f"exit {run.code}"
+                lines.append(f"  {started} {code} in {run.finished - run.started:.1f} s")
+                if run.output:
+                    lines.append("    " + run.output.replace("\n", "\n    "))
+            lines.append("")
+
         self.cmd_output.configure(state="normal")
         self.cmd_output.delete("1.0", tk.END)
-        self.cmd_output.insert("1.0", f"Exit code: {code}\n\n{output or '(no output)'}")
+        self.cmd_output.insert("1.0", "\n".join(lines) or "No scheduled jobs configured")
         self.cmd_output.configure(state="disabled")
-        self.status_var.set(f"Command finished with code {code}")
+        self.status_var.set(f"{len(self.scheduler.jobs)} scheduled job(s)")
+
+    def _on_close(self):
+        self._stop_command()
+        self.scheduler.shutdown()
+        self.root.destroy()
 
     def _save_notes(self):
         content = self.notes_text.get("1.0", tk.END)
@@ -525,7 +746,7 @@ class MiniOSHelperApp:
                 selectforeground=p["text"],
             )
 
-        for btn in (self.refresh_btn, self.run_btn, self.save_notes_btn):
+        for btn in (self.refresh_btn, self.run_btn, self.stop_btn, self.jobs_btn, self.save_notes_btn):
             btn.configure_theme(p, btn.master.cget("bg"))
 
         self.theme_box.configure(style="App.TCombobox")